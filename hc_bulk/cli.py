@@ -18,80 +18,200 @@ hc-bulk ls --tags prod --name-re 'etl'
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+import random
 import re
-import time
-from typing import Iterable, List, Optional
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Mapping, Optional
 
 import click
-from dotenv import load_dotenv
 from loguru import logger
-from tqdm import tqdm
-
-from healthchecks_io import (
-    Client,
-    Check,
-    CheckUpdate,
-    HCAPIRateLimitError,
-    HCAPIAuthError,
-    HCAPIError,
-)
 
-load_dotenv()
+# Undocumented CPython module, only used for optional regex analysis: if it is
+# missing or changes shape, the helpers that use it fall back to doing nothing.
+try:
+    import re._parser as sre_parse
+except ImportError:  # pragma: no cover
+    sre_parse = None
+
+# healthchecks_io (httpx + pydantic) and dotenv are imported where they are
+# used so that --help/--version and shell completion stay fast.
+if TYPE_CHECKING:
+    from healthchecks_io import AsyncClient, Check, CheckUpdate, Client
 
 # ---------- Client helpers ----------
 
-def make_client(
+def _client_kwargs(
     api_key: Optional[str],
     ping_key: Optional[str],
     api_url: Optional[str],
-) -> Client:
+) -> dict:
+    # .env is only read once a client is actually needed, keeping it off the
+    # --help path; every value below falls back to the environment.
+    from dotenv import load_dotenv
+
+    load_dotenv()
     api_key = api_key or os.getenv("HC_API_KEY") or os.getenv("HEALTHCHECKS_API_KEY")
     if not api_key:
         raise click.UsageError("Missing API key. Use --api-key or set HC_API_KEY.")
-    return Client(
+    return dict(
         api_key=api_key,
         ping_key=ping_key or os.getenv("HC_PING_KEY"),
         api_url=(api_url or os.getenv("HC_API_URL") or "https://healthchecks.io/api/"),
     )
 
 
-def fetch_checks(client: Client, tags: List[str] | None) -> List[Check]:
+def make_client(
+    api_key: Optional[str],
+    ping_key: Optional[str],
+    api_url: Optional[str],
+) -> Client:
+    from healthchecks_io import Client
+
+    return Client(**_client_kwargs(api_key, ping_key, api_url))
+
+
+def make_async_client(
+    api_key: Optional[str],
+    ping_key: Optional[str],
+    api_url: Optional[str],
+    *,
+    max_connections: int = 16,
+) -> AsyncClient:
+    import httpx
+    from healthchecks_io import AsyncClient
+
+    # HTTP/2 multiplexes concurrent requests over one pooled TLS connection
+    # instead of opening a new handshake per in-flight request.
+    http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        timeout=30,
+    )
+    return AsyncClient(**_client_kwargs(api_key, ping_key, api_url), client=http)
+
+
+def fetch_checks(client: Client, tags: List[str] | None) -> Iterator[Check]:
     # healthchecks-io supports filtering by a single tag per request;
     # the client’s get_checks(tags=[...]) handles multiple (AND semantics).
-    return client.get_checks(tags=tags or None)  # type: ignore[arg-type]
+    # The API is not paginated, so this streams the single response.
+    yield from client.get_checks(tags=tags or None)  # type: ignore[arg-type]
 
 
 # ---------- Filtering ----------
 
+def _validate_pattern(pattern: str, flags: int = 0) -> None:
+    """Warn about constructs prone to catastrophic backtracking."""
+    if sre_parse is None:
+        return
+    wildcards = 0
+    nested = False
+
+    def walk(items, in_repeat: bool) -> None:
+        nonlocal wildcards, nested
+        for op, av in items:
+            # Possessive repeats and atomic groups never backtrack, so skip them.
+            if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+                _, hi, sub = av
+                unbounded = hi == sre_parse.MAXREPEAT
+                if unbounded:
+                    nested |= in_repeat
+                    if len(sub) == 1 and sub[0][0] is sre_parse.ANY:
+                        wildcards += 1
+                walk(sub, in_repeat or unbounded)
+            elif op is sre_parse.SUBPATTERN:
+                walk(av[3], in_repeat)
+            elif op is sre_parse.BRANCH:
+                for branch in av[1]:
+                    walk(branch, in_repeat)
+            elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+                walk(av[1], in_repeat)
+            elif op is sre_parse.GROUPREF_EXISTS:
+                for branch in av[1:]:
+                    if branch is not None:
+                        walk(branch, in_repeat)
+
+    try:
+        walk(sre_parse.parse(pattern, flags), False)
+    except Exception:  # the warning is advisory; skip it if the parser changed
+        return
+    if nested:
+        logger.warning(
+            f"Pattern {pattern!r} nests unbounded repeats; it may backtrack catastrophically."
+        )
+    elif wildcards > 1:
+        logger.warning(
+            f"Pattern {pattern!r} has {wildcards} unbounded wildcards (.* / .+); "
+            "it may backtrack heavily."
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    compiled = re.compile(pattern, flags)
+    _validate_pattern(pattern, flags)
+    return compiled
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_literal(pattern: re.Pattern) -> Optional[str]:
+    """Longest literal substring every match of `pattern` must contain, if any."""
+    if sre_parse is None or pattern.flags & re.IGNORECASE or not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = list(sre_parse.parse(pattern.pattern, pattern.flags))
+        literal_op = sre_parse.LITERAL
+    except Exception:  # no pre-filter is always safe; plain search still runs
+        return None
+    # Top-level items of the parsed pattern are a plain concatenation, so any
+    # run of LITERAL opcodes there is required (alternations are a single BRANCH).
+    best, run = "", []
+    for op, av in parsed:
+        if op is literal_op:
+            run.append(chr(av))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    return best or None
+
+
 def _match_regex(val: str | None, pattern: Optional[re.Pattern]) -> bool:
     if pattern is None:
         return True
     return bool(val and pattern.search(val))
 
 
-def _match_status(val: str | None, statuses: set[str] | None) -> bool:
-    if not statuses:
-        return True
-    return (val or "").lower() in statuses
-
-
 def select_checks(
     checks: Iterable[Check],
     name_re: Optional[re.Pattern],
     slug_re: Optional[re.Pattern],
-    statuses: set[str] | None,
-) -> List[Check]:
-    selected: List[Check] = []
+    statuses: frozenset[str] | None,
+) -> Iterator[Check]:
+    # Cheap substring checks let most non-matching checks skip the regex engine.
+    name_lit = _extract_literal(name_re) if name_re is not None else None
+    slug_lit = _extract_literal(slug_re) if slug_re is not None else None
+    # Tests run cheapest first: set membership, then substrings, then regexes.
     for c in checks:
+        # Statuses come back from the API in canonical lowercase.
+        if statuses and c.status not in statuses:
+            continue
+        if name_lit and name_lit not in (c.name or ""):
+            continue
+        if slug_lit and slug_lit not in (c.slug or ""):
+            continue
         if not _match_regex(c.name, name_re):
             continue
         if not _match_regex(c.slug, slug_re):
             continue
-        if not _match_status(c.status, statuses):
-            continue
-        selected.append(c)
-    return selected
+        yield c
 
 
 # ---------- Tag utilities ----------
@@ -99,90 +219,176 @@ def select_checks(
 def compute_tags(
     current: str | None,
     set_tags: Optional[str],
-    add_tags: Optional[str],
-    remove_tags: Optional[str],
+    add_tags: tuple[str, ...],
+    remove_tags: frozenset[str],
 ) -> Optional[str]:
-    """Return new tag string or None (no change)."""
+    """Return new tag string or None (no change).
+
+    `add_tags`/`remove_tags` are pre-split once per run by the caller.
+    Existing tags keep their order and added ones are appended, so no sort
+    is needed.
+    """
     if set_tags is not None:
-        return set_tags.strip()
+        new = set_tags.strip()
+        return new if new != (current or "") else None
+    if not add_tags and not remove_tags:
+        return None
 
-    tags = set((current or "").split())
-    if add_tags:
-        tags |= set(add_tags.split())
-    if remove_tags:
-        tags -= set(remove_tags.split())
+    tags = (current or "").split()
+    have = set(tags)
+    added = [t for t in add_tags if t not in have and t not in remove_tags]
     # If no change, return None to leave unchanged.
-    new = " ".join(sorted(tags)).strip()
-    return new if new != (current or "") else None
+    if not added and have.isdisjoint(remove_tags):
+        return None
+    kept = dict.fromkeys(t for t in tags if t not in remove_tags)
+    return " ".join([*kept, *added])
 
 
 # ---------- Update application ----------
 
+# Non-tag fields that a fetched Check reports in the same form the CLI sets them,
+# so they can be compared to skip no-op updates. Check has no schedule/tz and
+# returns channels in a different format, so those are always sent when set.
+_DIFFABLE_FIELDS = frozenset({"name", "desc", "timeout", "grace", "methods", "manual_resume"})
+
+
+def build_template(fields: Mapping[str, Any]) -> CheckUpdate:
+    """Build the payload shared by every check once; tags are filled in per check."""
+    from healthchecks_io import CheckUpdate
+
+    # Basic payload – only include fields you want to change; omitted ones stay unchanged
+    return CheckUpdate(**fields)
+
+
 def build_update(
     check: Check,
     *,
-    set_name: Optional[str],
-    set_desc: Optional[str],
+    template: CheckUpdate,
+    template_fields: Mapping[str, Any],
+    interned: dict[tuple[tuple[str, ...], Optional[str]], CheckUpdate],
     set_tags: Optional[str],
-    add_tags: Optional[str],
-    remove_tags: Optional[str],
-    set_timeout: Optional[int],
-    set_grace: Optional[int],
-    set_schedule: Optional[str],
-    set_tz: Optional[str],
-    set_methods: Optional[str],
-    set_channels: Optional[str],
-    manual_resume: Optional[bool],
+    add_tags: tuple[str, ...],
+    remove_tags: frozenset[str],
 ) -> Optional[CheckUpdate]:
-    # tags
-    tags_new = compute_tags(check.tags, set_tags, add_tags, remove_tags)
-    # Basic payload – only include fields you want to change; omitted ones stay unchanged
-    payload = CheckUpdate(
-        name=set_name,
-        desc=set_desc,
-        tags=tags_new,
-        timeout=set_timeout,
-        grace=set_grace,
-        schedule=set_schedule,
-        tz=set_tz,
-        methods=set_methods,
-        channels=set_channels,  # comma-separated integration IDs (string)
-        manual_resume=manual_resume,
-        unique=None,
-    )
+    """Return the update for `check`, or None if nothing changes.
 
+    `template_fields` holds the non-tag fields set in `template`. Those in
+    `_DIFFABLE_FIELDS` that the check already has are dropped, so unchanged
+    checks cost no API call. Checks needing the same changes share one
+    payload object via `interned`.
+    """
     # If pause requested, we don't put it in CheckUpdate (pause is its own API call)
-    # Decide whether payload is "empty" (no field set)
-    if (
-        payload.name is None
-        and payload.desc is None
-        and payload.tags is None
-        and payload.timeout is None
-        and payload.grace is None
-        and payload.schedule is None
-        and payload.tz is None
-        and payload.methods is None
-        and payload.channels is None
-        and payload.manual_resume is None
-    ):
-        return None
+    tags_new = compute_tags(check.tags, set_tags, add_tags, remove_tags)
+    unchanged = tuple(
+        k
+        for k, v in template_fields.items()
+        if k in _DIFFABLE_FIELDS and getattr(check, k, None) == v
+    )
+    if tags_new is None:
+        if len(unchanged) == len(template_fields):
+            return None
+        if not unchanged:
+            return template
+    key = (unchanged, tags_new)
+    payload = interned.get(key)
+    if payload is None:
+        update: dict[str, object] = dict.fromkeys(unchanged)  # None = left unchanged
+        if tags_new is not None:
+            update["tags"] = tags_new
+        # model_copy skips re-validating the fields already checked in the template
+        payload = interned[key] = template.model_copy(update=update)
     return payload
 
 
-def retry_on_ratelimit(func, *, max_sleep: float = 8.0):
-    """Simple exponential backoff wrapper for 429s."""
-    def wrapper(*args, **kwargs):
+def retry_on_ratelimit(func, *, max_sleep: float = 8.0, max_attempts: int = 8):
+    """Exponential backoff wrapper for 429s (async client calls).
+
+    Delays are jittered so concurrent requests that were throttled together
+    don't all retry at the same instant; gives up after `max_attempts`.
+    """
+    from healthchecks_io import HCAPIRateLimitError
+
+    async def wrapper(*args, **kwargs):
         delay = 1.0
-        while True:
+        for attempt in range(1, max_attempts + 1):
             try:
-                return func(*args, **kwargs)
+                return await func(*args, **kwargs)
             except HCAPIRateLimitError as e:
-                logger.warning(f"Rate limited: {e}; sleeping {delay:.1f}s")
-                time.sleep(delay)
+                if attempt == max_attempts:
+                    raise
+                sleep = min(max_sleep, delay * (0.5 + random.random()))
+                logger.warning(f"Rate limited: {e}; sleeping {sleep:.1f}s")
+                await asyncio.sleep(sleep)
                 delay = min(max_sleep, delay * 2)
     return wrapper
 
 
+async def _execute_plan(
+    new_client: Callable[[], AsyncClient],
+    plan: list[tuple[Check, Optional[CheckUpdate], bool]],
+    *,
+    concurrency: int,
+    progress: bool,
+) -> int:
+    """Run all planned updates/pauses concurrently; return the number of failed checks.
+
+    The client is created and closed inside the running event loop, so its
+    pooled connections never outlive the loop they belong to.
+    """
+    async with new_client() as client:
+        return await _run_plan(client, plan, concurrency=concurrency, progress=progress)
+
+
+async def _run_plan(
+    client: AsyncClient,
+    plan: list[tuple[Check, Optional[CheckUpdate], bool]],
+    *,
+    concurrency: int,
+    progress: bool,
+) -> int:
+    import httpx
+    from healthchecks_io import HCAPIError
+
+    do_update = retry_on_ratelimit(client.update_check)
+    do_pause = retry_on_ratelimit(client.pause_check)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(c: Check, upd: Optional[CheckUpdate], want_pause: bool) -> None:
+        async with sem:
+            if upd is not None:
+                _ = await do_update(c.uuid, upd)  # returns the updated Check
+            if want_pause:
+                _ = await do_pause(c.uuid)
+
+    with click.progressbar(
+        length=len(plan),
+        label="Applying",
+        file=sys.stderr,
+        # Redraw about 100 times over the run rather than once per check.
+        update_min_steps=max(1, len(plan) // 100),
+        hidden=not (progress and sys.stderr.isatty()),
+    ) as bar:
+        tasks = [asyncio.create_task(_one(c, upd, wp)) for c, upd, wp in plan]
+        for t in tasks:
+            t.add_done_callback(lambda _: bar.update(1))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # API and transport failures (timeouts, dropped connections) count against
+    # their own check; anything else is logged for every check, then re-raised.
+    errors = 0
+    unexpected: list[BaseException] = []
+    for (c, _, _), res in zip(plan, results):
+        if isinstance(res, (HCAPIError, httpx.HTTPError)):
+            errors += 1
+            logger.error(f"{c.name or c.uuid}: {str(res) or type(res).__name__}")
+        elif isinstance(res, BaseException):
+            unexpected.append(res)
+            logger.opt(exception=res).error(f"{c.name or c.uuid}: unexpected error")
+    if unexpected:
+        raise unexpected[0]
+    return errors
+
+
 # ---------- CLI ----------
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
@@ -210,10 +416,11 @@ def cmd_ls(api_key, ping_key, api_url, tags, name_re, slug_re, statuses):
     client = make_client(api_key, ping_key, api_url)
     checks = fetch_checks(client, list(tags) or None)
 
-    name_rx = re.compile(name_re) if name_re else None
-    slug_rx = re.compile(slug_re) if slug_re else None
-    statuses_set = set(s.lower() for s in statuses) if statuses else None
-    selected = select_checks(checks, name_rx, slug_rx, statuses_set)
+    name_rx = _compile(name_re) if name_re else None
+    slug_rx = _compile(slug_re, re.ASCII) if slug_re else None  # slugs are ASCII
+    statuses_set = frozenset(s.lower() for s in statuses) if statuses else None
+
+    selected = list(select_checks(checks, name_rx, slug_rx, statuses_set))
 
     click.echo(f"{len(selected)} check(s) matched.")
     for c in selected:
@@ -260,6 +467,13 @@ def cmd_ls(api_key, ping_key, api_url, tags, name_re, slug_re, statuses):
 @click.option("--dry-run", is_flag=True, help="Show what would change, do nothing.")
 @click.option("-y", "--yes", is_flag=True, help="Do not prompt for confirmation.")
 @click.option("--progress/--no-progress", default=True, help="Show a progress bar.")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=16,
+    show_default=True,
+    help="Maximum number of in-flight API requests.",
+)
 def cmd_bulk_update(
     api_key: Optional[str],
     ping_key: Optional[str],
@@ -284,54 +498,77 @@ def cmd_bulk_update(
     dry_run: bool,
     yes: bool,
     progress: bool = True,
+    concurrency: int = 16,
 ):
     """Bulk edit checks: select by filters, then apply updates and/or pause."""
     client = make_client(api_key, ping_key, api_url)
     checks = fetch_checks(client, list(tags) or None)
 
-    name_rx = re.compile(name_re) if name_re else None
-    slug_rx = re.compile(slug_re) if slug_re else None
-    statuses_set = set(s.lower() for s in statuses) if statuses else None
-    selected = select_checks(checks, name_rx, slug_rx, statuses_set)
+    name_rx = _compile(name_re) if name_re else None
+    slug_rx = _compile(slug_re, re.ASCII) if slug_re else None  # slugs are ASCII
+    statuses_set = frozenset(s.lower() for s in statuses) if statuses else None
+
+    # Validate the shared payload once and split tag operations once, not per check
+    template_fields = {
+        k: v
+        for k, v in dict(
+            name=set_name,
+            desc=set_desc,
+            timeout=set_timeout,
+            grace=set_grace,
+            schedule=set_schedule,
+            tz=set_tz,
+            methods=set_methods,
+            channels=set_channels,  # comma-separated integration IDs (string)
+            manual_resume=manual_resume,
+        ).items()
+        if v is not None
+    }
+    template = build_template(template_fields)
+    add_seq = tuple(dict.fromkeys(add_tags.split())) if add_tags else ()
+    remove_set = frozenset(remove_tags.split()) if remove_tags else frozenset()
+
+    # Everything but the check itself is fixed for the run; bind it once.
+    make_update = functools.partial(
+        build_update,
+        template=template,
+        template_fields=template_fields,
+        interned={},
+        set_tags=set_tags,
+        add_tags=add_seq,
+        remove_tags=remove_set,
+    )
+
+    selected = list(select_checks(checks, name_rx, slug_rx, statuses_set))
 
     if not selected:
         click.echo("No checks matched filters.")
         return
 
+    # Preview, build updates and count actions in a single pass;
+    # checks with nothing to do never enter the plan.
     click.echo(f"{len(selected)} check(s) matched. Preview:")
+    plan: list[tuple[Check, Optional[CheckUpdate], bool]] = []
+    n_update = 0
     for c in selected:
         click.echo(
             f"- {c.name or '(no-name)'} [{c.status}] tags='{c.tags or ''}' uuid={c.uuid}"
         )
-
-    # Build per-check update objects (only changed fields are included)
-    plan: list[tuple[Check, Optional[CheckUpdate], bool]] = []
-    for c in selected:
-        upd = build_update(
-            c,
-            set_name=set_name,
-            set_desc=set_desc,
-            set_tags=set_tags,
-            add_tags=add_tags,
-            remove_tags=remove_tags,
-            set_timeout=set_timeout,
-            set_grace=set_grace,
-            set_schedule=set_schedule,
-            set_tz=set_tz,
-            set_methods=set_methods,
-            set_channels=set_channels,
-            manual_resume=manual_resume,
-        )
+        upd = make_update(c)
+        if upd is None and not pause:
+            continue
+        n_update += upd is not None
         plan.append((c, upd, pause))
 
     # Summarize planned actions
-    to_update = [p for p in plan if p[1] is not None]
-    to_pause = [p for p in plan if p[2]]
     click.echo(
-        f"\nPlanned: {len(to_update)} update(s)"
-        + (f", {len(to_pause)} pause(s)" if pause else "")
+        f"\nPlanned: {n_update} update(s)"
+        + (f", {len(plan)} pause(s)" if pause else "")
         + (" (dry-run)" if dry_run else "")
     )
+    if not plan:
+        click.echo("Nothing to do.")
+        return
 
     if not yes and not dry_run:
         if not click.confirm("Proceed?", default=False):
@@ -342,20 +579,16 @@ def cmd_bulk_update(
     if dry_run:
         return
 
-    do_update = retry_on_ratelimit(client.update_check)
-    do_pause = retry_on_ratelimit(client.pause_check)
-
-    iterable = tqdm(plan, disable=not progress, desc="Applying")  # type: ignore[arg-type]
-    errors = 0
-    for c, upd, want_pause in iterable:
-        try:
-            if upd is not None:
-                _ = do_update(c.uuid, upd)  # returns the updated Check
-            if want_pause:
-                _ = do_pause(c.uuid)
-        except (HCAPIAuthError, HCAPIError) as e:
-            errors += 1
-            logger.error(f"{c.name or c.uuid}: {e}")
+    errors = asyncio.run(
+        _execute_plan(
+            functools.partial(
+                make_async_client, api_key, ping_key, api_url, max_connections=concurrency
+            ),
+            plan,
+            concurrency=concurrency,
+            progress=progress,
+        )
+    )
 
     if errors:
         raise SystemExit(f"Done with {errors} error(s).")
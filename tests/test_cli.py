@@ -0,0 +1,248 @@
+import asyncio
+import random
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from hc_bulk import cli
+
+
+def make_check(name="", slug="", status="up", tags=""):
+    return SimpleNamespace(name=name, slug=slug, status=status, tags=tags)
+
+
+# ---------- _extract_literal / select_checks ----------
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [
+        ("backup", "backup"),
+        ("^worker-", "worker-"),
+        ("docker-system$", "docker-system"),
+        ("a.*bc", "bc"),
+        ("ab?c", "a"),
+        ("[ab]cd", "cd"),
+        (r"\bfoo\d+bar_baz", "bar_baz"),
+        ("é-è", "é-è"),
+        ("foo|bar", None),
+        ("(?i)abc", None),
+        (r"\d+", None),
+    ],
+)
+def test_extract_literal(pattern, literal):
+    assert cli._extract_literal(re.compile(pattern)) == literal
+
+
+def test_extract_literal_without_parser(monkeypatch):
+    monkeypatch.setattr(cli, "sre_parse", None)
+    cli._extract_literal.cache_clear()
+    try:
+        assert cli._extract_literal(re.compile("backup")) is None
+    finally:
+        cli._extract_literal.cache_clear()
+
+
+def test_literal_prefilter_matches_plain_search():
+    rng = random.Random(0)
+    alphabet = "ab-_.x"
+    patterns = [
+        "ab", "a.b", "^ab", "b$", "a-b", "(ab)+x", "a|b", "x?ab", "[ab]x", "a{2}",
+        r"a\.b", "a.*b", "(?:ab|xa)b", "ab(?=x)", "(?!a)b",
+    ]
+    names = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8))) for _ in range(300)]
+    checks = [make_check(name=n, slug=n) for n in names]
+    for p in patterns:
+        rx = re.compile(p)
+        expected = [c for c in checks if c.name and rx.search(c.name)]
+        assert list(cli.select_checks(checks, rx, None, None)) == expected, p
+        expected = [c for c in checks if c.slug and rx.search(c.slug)]
+        assert list(cli.select_checks(checks, None, rx, None)) == expected, p
+
+
+# ---------- retry_on_ratelimit ----------
+
+def test_retry_sleeps_are_capped_and_attempts_bounded(monkeypatch):
+    from healthchecks_io import HCAPIRateLimitError
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    async def always_limited():
+        raise HCAPIRateLimitError("429")
+
+    monkeypatch.setattr(cli.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(cli.random, "random", lambda: 0.999)
+    wrapped = cli.retry_on_ratelimit(always_limited, max_sleep=8.0, max_attempts=6)
+    with pytest.raises(HCAPIRateLimitError):
+        asyncio.run(wrapped())
+    assert len(sleeps) == 5
+    assert max(sleeps) <= 8.0
+
+
+# ---------- _validate_pattern ----------
+
+@pytest.mark.parametrize(
+    "pattern, warned",
+    [
+        ("backup", False),
+        ("a.*b", False),
+        (r"\d+-\w+", False),
+        ("a.*b.*c", True),
+        ("a.+b.*", True),
+        ("(a+)+$", True),
+        ("(?:x|y*)*", True),
+        ("(a*+)*", False),
+        ("(?>a*)*", False),
+    ],
+)
+def test_validate_pattern(monkeypatch, pattern, warned):
+    warnings = []
+    monkeypatch.setattr(cli.logger, "warning", warnings.append)
+    cli._validate_pattern(pattern)
+    assert bool(warnings) is warned
+
+
+def test_validate_pattern_without_parser(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(cli.logger, "warning", warnings.append)
+    monkeypatch.setattr(cli, "sre_parse", None)
+    cli._validate_pattern("(a+)+$")
+    assert warnings == []
+
+
+# ---------- compute_tags ----------
+
+@pytest.mark.parametrize(
+    "current, set_tags, add, remove, expected",
+    [
+        ("b a", None, (), frozenset(), None),
+        ("b a", None, ("a",), frozenset(), None),
+        ("b a", None, ("c", "a"), frozenset(), "b a c"),
+        ("b a c", None, (), frozenset({"a"}), "b c"),
+        ("b a", None, ("x",), frozenset({"x"}), None),
+        (None, None, ("x",), frozenset(), "x"),
+        ("a", None, (), frozenset({"a"}), ""),
+        ("a a", None, ("b",), frozenset(), "a b"),
+        ("prod", " prod ", (), frozenset(), None),
+        ("prod", "prod daily", (), frozenset(), "prod daily"),
+    ],
+)
+def test_compute_tags(current, set_tags, add, remove, expected):
+    assert cli.compute_tags(current, set_tags, add, remove) == expected
+
+
+# ---------- build_update ----------
+
+def make_updater(set_tags=None, add=(), remove=frozenset(), **fields):
+    template = cli.build_template(fields)
+    interned = {}
+    return lambda check: cli.build_update(
+        check,
+        template=template,
+        template_fields=fields,
+        interned=interned,
+        set_tags=set_tags,
+        add_tags=add,
+        remove_tags=remove,
+    ), template
+
+
+def full_check(**overrides):
+    attrs = dict(
+        name="job", desc="", tags="prod", timeout=86400, grace=3600,
+        methods="", manual_resume=False, channels="c1",
+    )
+    attrs.update(overrides)
+    return SimpleNamespace(**attrs)
+
+
+def sent(update):
+    # What the client puts on the wire for update_check.
+    return update.model_dump(exclude_unset=True, exclude_none=True)
+
+
+def test_build_update_skips_fields_the_check_already_has():
+    update, _ = make_updater(name="job", grace=3600, manual_resume=False)
+    assert update(full_check()) is None
+    assert sent(update(full_check(grace=60))) == {"grace": 3600}
+
+
+def test_build_update_reuses_template_when_every_field_differs():
+    update, template = make_updater(name="new", grace=120)
+    assert update(full_check()) is template
+
+
+def test_build_update_always_sends_fields_check_does_not_expose():
+    update, _ = make_updater(schedule="0 3 * * *", tz="UTC", channels="c1")
+    assert sent(update(full_check())) == {"schedule": "0 3 * * *", "tz": "UTC", "channels": "c1"}
+
+
+def test_build_update_shares_payloads_for_identical_changes():
+    update, _ = make_updater(add=("new",), name="job", grace=120)
+    first, second = update(full_check()), update(full_check())
+    assert first is second
+    assert sent(first) == {"grace": 120, "tags": "prod new"}
+    assert update(full_check(tags="dev")) is not first
+
+
+def test_build_update_without_changes():
+    update, _ = make_updater()
+    assert update(full_check()) is None
+    update, _ = make_updater(add=("prod",))
+    assert update(full_check()) is None
+
+
+# ---------- _execute_plan ----------
+
+class FakeAsyncClient:
+    def __init__(self, failures):
+        self.failures = failures
+        self.done = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def update_check(self, uuid, update):
+        await asyncio.sleep(0)
+        if uuid in self.failures:
+            raise self.failures[uuid]
+        self.done.append(uuid)
+
+    async def pause_check(self, uuid):
+        await self.update_check(uuid, None)
+
+
+def test_execute_plan_counts_api_errors_and_reraises_unexpected():
+    import httpx
+    from healthchecks_io import HCAPIError
+
+    failures = {
+        "u1": HCAPIError("boom"),
+        "u2": httpx.ConnectTimeout("slow"),
+        "u3": ValueError("bug"),
+    }
+    client = FakeAsyncClient(failures)
+    plan = [
+        (SimpleNamespace(name=f"job-{i}", uuid=f"u{i}"), object(), i == 4)
+        for i in range(1, 6)
+    ]
+
+    def run():
+        return cli._execute_plan(lambda: client, plan, concurrency=2, progress=False)
+
+    with pytest.raises(ValueError, match="bug"):
+        asyncio.run(run())
+    # The unexpected error surfaces only after every other check was applied.
+    assert client.done == ["u4", "u4", "u5"]
+    assert client.closed
+
+    del failures["u3"]
+    client.done.clear()
+    assert asyncio.run(run()) == 2